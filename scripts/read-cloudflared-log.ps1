@@ -0,0 +1,51 @@
+<#
+.SYNOPSIS
+  Read newly appended cloudflared log output (GitHub Actions friendly)
+.DESCRIPTION
+  Reads only the bytes cloudflared has appended to its stderr log since the previous call.
+  The read offset and a short tail are kept in the caller's -State hashtable, so a URL split
+  across two reads still matches. Returns the new text (prefixed with that tail) and the first
+  quick-tunnel URL found in it, or $null when nothing new has been written.
+#>
+[CmdletBinding()]
+param(
+  [Parameter(Mandatory = $true)][string]$Path,
+  [Parameter(Mandatory = $true)][hashtable]$State
+)
+
+$ErrorActionPreference = 'Stop'
+Set-StrictMode -Version Latest
+
+# Quick-tunnel hostnames; skip api.trycloudflare.com, which appears in cloudflared's request errors
+$urlPattern = 'https://(?!api\.)[a-zA-Z0-9\-]+\.trycloudflare\.com'
+
+if (-not $State.ContainsKey('Offset')) { $State.Offset = 0 }
+if (-not $State.ContainsKey('Tail')) { $State.Tail = '' }
+
+try {
+  $fs = [System.IO.File]::Open($Path, 'Open', 'Read', 'ReadWrite')
+  try {
+    if ($fs.Length -le $State.Offset) {
+      return $null
+    }
+    $null = $fs.Seek($State.Offset, 'Begin')
+    $buf = New-Object byte[] ($fs.Length - $State.Offset)
+    $read = $fs.Read($buf, 0, $buf.Length)
+    $State.Offset += $read
+  } finally {
+    $fs.Dispose()
+  }
+} catch [System.IO.IOException] {
+  # Transient sharing violation while cloudflared writes the log; the caller retries next poll
+  return $null
+}
+
+$text = $State.Tail + [System.Text.Encoding]::UTF8.GetString($buf, 0, $read)
+# Keep a short tail so a match split across two reads is still found
+$State.Tail = if ($text.Length -gt 128) { $text.Substring($text.Length - 128) } else { $text }
+
+$match = [regex]::Match($text, $urlPattern)
+[pscustomobject]@{
+  Text      = $text
+  TunnelUrl = if ($match.Success) { $match.Value } else { $null }
+}